@@ -1,10 +1,163 @@
-import math, random as rand
+import random as rand
+
+BASE_DIGITS = 18
+BASE = 10**BASE_DIGITS
+KARATSUBA_THRESHOLD = 24
+
+def _mul_kernel(u: list[int], v: list[int], w: list[int]) -> None:
+    """Accumulates the schoolbook product of two limb lists into an output limb list.
+
+    Args:
+        u (list[int]): The limbs of the first factor.
+        v (list[int]): The limbs of the second factor.
+        w (list[int]): The zero-initialized output limbs, with room for at least `len(u) + len(v)` limbs.
+    """
+    base = BASE
+    n = len(u)
+    for j, vj in enumerate(v):
+        if vj == 0: continue
+
+        k = 0
+        i = j
+        for ui in u:
+            k, w[i] = divmod(ui * vj + w[i] + k, base)
+            i += 1
+        w[j + n] = k
+
+def _add_limbs(a: list[int], b: list[int]) -> list[int]:
+    """Computes the sum of two limb lists in a single carry pass.
+
+    Args:
+        a (list[int]): The limbs of the first term.
+        b (list[int]): The limbs of the second term.
+
+    Returns:
+        list[int]: The limbs of the sum.
+    """
+    base = BASE
+    la, lb = len(a), len(b)
+    n = max(la, lb)
+    r = [0] * (n + 1)
+    carry = 0
+    for i in range(n):
+        s = (a[i] if i < la else 0) + (b[i] if i < lb else 0) + carry
+        if s >= base:
+            r[i] = s - base
+            carry = 1
+        else:
+            r[i] = s
+            carry = 0
+
+    if carry != 0: r[n] = carry
+    else: r.pop()
+    return r
+
+def _sub_limbs(a: list[int], b: list[int]) -> list[int]:
+    """Computes the difference of two limb lists in a single borrow pass.
+
+    Args:
+        a (list[int]): The limbs of the minuend. Must represent a value no less than `b`, in no fewer limbs.
+        b (list[int]): The limbs of the subtrahend.
+
+    Returns:
+        list[int]: The limbs of the difference, with as many limbs as `a`.
+    """
+    base = BASE
+    lb = len(b)
+    r = a[:]
+    borrow = 0
+    for i in range(len(a)):
+        s = a[i] - (b[i] if i < lb else 0) - borrow
+        if s < 0:
+            r[i] = s + base
+            borrow = 1
+        else:
+            r[i] = s
+            borrow = 0
+    return r
+
+def _add_into(w: list[int], a: list[int], offset: int) -> None:
+    """Adds a limb list into another limb list in place, starting at the given limb offset.
+
+    Args:
+        w (list[int]): The limbs to add into. Must have room for the sum.
+        a (list[int]): The limbs to add. Any limbs that would fall past the end of `w` must be zero.
+        offset (int): The limb index of `w` at which the least significant limb of `a` is added.
+    """
+    base = BASE
+    carry = 0
+    i = offset
+    for i in range(offset, min(len(w), offset + len(a))):
+        s = w[i] + a[i - offset] + carry
+        if s >= base:
+            w[i] = s - base
+            carry = 1
+        else:
+            w[i] = s
+            carry = 0
+
+    i += 1
+    while carry != 0:
+        carry, w[i] = divmod(w[i] + carry, base)
+        i += 1
+
+def _karatsuba(u: list[int], v: list[int]) -> list[int]:
+    """Computes the product of two limb lists with the Karatsuba algorithm.
+
+    Args:
+        u (list[int]): The limbs of the first factor.
+        v (list[int]): The limbs of the second factor.
+
+    Returns:
+        list[int]: The limbs of the product, with exactly `len(u) + len(v)` limbs.
+    """
+    if len(u) > len(v): u, v = v, u
+    lu, lv = len(u), len(v)
+    w = [0] * (lu + lv)
+
+    if 2 * lu <= lv:
+        # Unbalanced operands: the short factor would not split, so multiply it by slices of the long factor instead
+        for i in range(0, lv, lu):
+            _add_into(w, _mul_limbs(u, v[i:i + lu]), i)
+        return w
+
+    m = lu // 2
+    u0, u1 = u[:m], u[m:]
+    v0, v1 = v[:m], v[m:]
+
+    z0 = _mul_limbs(u0, v0)
+    z2 = _mul_limbs(u1, v1)
+    z1 = _sub_limbs(_sub_limbs(_mul_limbs(_add_limbs(u0, u1), _add_limbs(v0, v1)), z0), z2)
+
+    _add_into(w, z0, 0)
+    _add_into(w, z1, m)
+    _add_into(w, z2, 2 * m)
+    return w
+
+def _mul_limbs(u: list[int], v: list[int]) -> list[int]:
+    """Computes the product of two limb lists, choosing the algorithm by operand size.
+
+    Args:
+        u (list[int]): The limbs of the first factor.
+        v (list[int]): The limbs of the second factor.
+
+    Returns:
+        list[int]: The limbs of the product, with exactly `len(u) + len(v)` limbs.
+    """
+    if min(len(u), len(v)) < KARATSUBA_THRESHOLD:
+        w = [0] * (len(u) + len(v))
+        _mul_kernel(u, v, w)
+        return w
+    return _karatsuba(u, v)
 
 class BigInt:
     """
     Represents a big integer, that can have an arbitrary amount of digits.
+    The digits are stored as little-endian limbs in base `BASE`, each holding `BASE_DIGITS` decimal digits.
     """
 
+    __slots__ = ("_digits",)
+
     def __init__(
             self, *,
             value: int | None = None,
@@ -24,63 +177,157 @@ class BigInt:
         self._digits: list[int] = []
         if value is not None:
             if value < 0: raise NotImplementedError("negative value not implemented")
-            if value != 0:
-                val_dc = int(math.log10(value)) + 1
-                num_dc = val_dc if digit_count is None else min(val_dc, digit_count)
+            if digit_count is not None: value %= 10**digit_count
 
-                for _ in range(num_dc):
-                    self._digits.append(value % 10)
-                    value //= 10
+            while value != 0:
+                value, limb = divmod(value, BASE)
+                self._digits.append(limb)
         else:
             if digit_count is None: raise ValueError("provide at least a value or a digit count")
-            for i in range(digit_count):
-                self._digits.append(rand.randint(0 if i < digit_count - 1 else 1, 9))
+            limb_count = -(-digit_count // BASE_DIGITS)
+            digits = self._digits = [0] * limb_count
+            if limb_count == 0: return
+
+            # Draw whole limbs at once, rejecting the few bit patterns that overflow the base
+            bits = BASE.bit_length()
+            for i in range(limb_count - 1):
+                limb = rand.getrandbits(bits)
+                while limb >= BASE: limb = rand.getrandbits(bits)
+                digits[i] = limb
+
+            top_digit_count = digit_count - (limb_count - 1) * BASE_DIGITS
+            digits[-1] = rand.randint(10**(top_digit_count - 1), 10**top_digit_count - 1)
     
+    @classmethod
+    def _from_limbs(cls, limbs: list[int]):
+        """Creates an instance of `BigInt` that takes ownership of the given limbs, bypassing the constructor.
+
+        Args:
+            limbs (list[int]): The normalized little-endian limbs of the value.
+
+        Returns:
+            BigInt: The big integer represented by the limbs.
+        """
+        c = cls.__new__(cls)
+        c._digits = limbs
+        return c
+
     def clone(self):
         """Creates a clone of this `BigInt` instance.
 
         Returns:
             BigInt: A deep copy of the instance.
         """
-        c = BigInt(digit_count=0)
-        for digit in self._digits: c._digits.append(digit)
-        return c
+        return BigInt._from_limbs(self._digits[:])
 
     def add_at(self, idx: int, value: int) -> None:
-        """Adds a value at the specified decimal position. Supports carry computation.
+        """Adds a value at the specified limb position. Supports carry computation.
 
         Args:
-            idx (int): The index at which to add the value.
+            idx (int): The limb index at which to add the value.
             value (int): The value to add to the number.
 
         Raises:
             NotImplementedError: The given argument values are not currently supported.
         """
         if value < 0: raise NotImplementedError("negative value not implemented")
-        if value == 0: return
 
-        while idx >= len(self): self._digits.append(0)
-        
-        new_val = self._digits[idx] + value
-        self._digits[idx] = new_val % 10
-        self.add_at(idx + 1, new_val // 10)
+        digits = self._digits
+        while value != 0:
+            if idx >= len(digits): digits.extend([0] * (idx - len(digits) + 1))
+
+            value, digits[idx] = divmod(digits[idx] + value, BASE)
+            idx += 1
+
+    def digit_at_decimal(self, pos: int) -> int:
+        """Returns the decimal digit at the specified decimal position.
+
+        Args:
+            pos (int): The decimal position of the digit, where 0 is the least significant digit.
+
+        Raises:
+            IndexError: `pos` is negative.
+
+        Returns:
+            int: The digit at the given position, or 0 if the position lies beyond the most significant digit.
+        """
+        if pos < 0: raise IndexError("negative decimal position")
+
+        digits = self._digits
+        limb_idx, offset = divmod(pos, BASE_DIGITS)
+        if limb_idx >= len(digits): return 0
+        return digits[limb_idx] // 10**offset % 10
+
+    def set_digit_at_decimal(self, pos: int, digit: int) -> None:
+        """Replaces the decimal digit at the specified decimal position.
+
+        Args:
+            pos (int): The decimal position of the digit, where 0 is the least significant digit.
+            digit (int): The new value of the digit.
+
+        Raises:
+            IndexError: `pos` is negative.
+            ValueError: `digit` is not a decimal digit.
+        """
+        if pos < 0: raise IndexError("negative decimal position")
+        if not 0 <= digit <= 9: raise ValueError("not a decimal digit")
+
+        digits = self._digits
+        limb_idx, offset = divmod(pos, BASE_DIGITS)
+        if limb_idx >= len(digits): digits.extend([0] * (limb_idx - len(digits) + 1))
+
+        scale = 10**offset
+        limb = digits[limb_idx]
+        digits[limb_idx] = limb + (digit - limb // scale % 10) * scale
+        while digits and digits[-1] == 0: digits.pop()
 
     @property
-    def digits(self) -> list[int]:
-        """The digits of this big integer.
+    def digits(self) -> tuple[int, ...]:
+        """The decimal digits of this big integer, from the least significant digit.
 
         Returns:
-            list[int]: A list containing the digits of this big integer.
+            tuple[int, ...]: A tuple containing the decimal digits of this big integer.
+        """
+        digits = []
+        append = digits.append
+        for limb in self._digits:
+            for _ in range(BASE_DIGITS):
+                limb, digit = divmod(limb, 10)
+                append(digit)
+
+        del digits[len(self):]
+        return tuple(digits)
+
+    @digits.setter
+    def digits(self, digits: list[int] | tuple[int, ...]) -> None:
+        """Replaces the value of this big integer with the given decimal digits.
+
+        Args:
+            digits (list[int] | tuple[int, ...]): The decimal digits of the new value, from the least significant digit.
+
+        Raises:
+            ValueError: An item of `digits` is not a decimal digit.
         """
-        return self._digits
+        if not all(0 <= digit <= 9 for digit in digits): raise ValueError("not a decimal digit")
+
+        limbs = [0] * -(-len(digits) // BASE_DIGITS)
+        for limb_idx, i in enumerate(range(0, len(digits), BASE_DIGITS)):
+            limb = 0
+            for digit in reversed(digits[i:i + BASE_DIGITS]): limb = limb * 10 + digit
+            limbs[limb_idx] = limb
+
+        while limbs and limbs[-1] == 0: limbs.pop()
+        self._digits = limbs
 
     def __len__(self) -> int:
-        """Returns the number of digits in this big integer.
+        """Returns the number of decimal digits in this big integer.
 
         Returns:
-            int: The number of digits in this big integer.
+            int: The number of decimal digits in this big integer.
         """
-        return len(self._digits)
+        digits = self._digits
+        if not digits: return 0
+        return (len(digits) - 1) * BASE_DIGITS + len(str(digits[-1]))
 
     def __eq__(self, other: object) -> bool:
         """Checks whether this big integer is equal (in integral value) to another big integer.
@@ -92,13 +339,7 @@ class BigInt:
             bool: `False` if `object` is not a `BigInt` or `object` represents a different integral value. Otherwise, returns `True`.
         """
         if not isinstance(other, BigInt): return False
-        if len(self) != len(other): return False
-
-        eq = True
-        for i in range(len(self)):
-            eq = self._digits[i] == other._digits[i]
-            if not eq: break
-        return eq
+        return self._digits == other._digits
 
     def __gt__(self, other: object) -> bool:
         """Returns whether this big integer is greater than another big integer.
@@ -113,15 +354,31 @@ class BigInt:
             bool: `True` if this big integer represents a value greater than `other`. Otherwise, returns `False`.
         """
         if not isinstance(other, BigInt): raise TypeError("not a BigNumber")
-        if len(self) != len(other): return len(self) > len(other)
+        d, od = self._digits, other._digits
+        n, on = len(d), len(od)
+        if n != on: return n > on
+
+        # Reversed limb lists are most significant first, so list order matches integral order
+        return d[::-1] > od[::-1]
+
+    def __lt__(self, other: object) -> bool:
+        """Returns whether this big integer is less than another big integer.
 
-        nlt, gt = True, False
-        for i in range(len(self) - 1, -1, -1):
-            d1, d2 = self._digits[i], other._digits[i]
-            nlt = d1 >= d2
-            gt = d1 > d2
-            if gt or not nlt: break
-        return gt
+        Args:
+            other (object): The object to compare.
+
+        Raises:
+            TypeError: `other` is not a `BigInt`.
+
+        Returns:
+            bool: `True` if this big integer represents a value less than `other`. Otherwise, returns `False`.
+        """
+        if not isinstance(other, BigInt): raise TypeError("not a BigNumber")
+        d, od = self._digits, other._digits
+        n, on = len(d), len(od)
+        if n != on: return n < on
+
+        return d[::-1] < od[::-1]
 
     def __ge__(self, other: object) -> bool:
         """Returns whether this big integer is greater than or equal to another big integer.
@@ -167,14 +424,7 @@ class BigInt:
         """
         if not isinstance(other, BigInt): raise TypeError("not a BigNumber")
         
-        result = BigInt(digit_count=0)
-        for i in range(max(len(self), len(other))):
-            a = self._digits[i] if i < len(self) else 0
-            b = other._digits[i] if i < len(other) else 0
-
-            result.add_at(i, a + b)
-        
-        return result
+        return BigInt._from_limbs(_add_limbs(self._digits, other._digits))
     
     def __mul__(self, other: object):
         """Computes the product of two big integers.
@@ -190,18 +440,15 @@ class BigInt:
         """
         if not isinstance(other, BigInt): raise TypeError("not a BigNumber")
 
-        result = BigInt(digit_count=0)
-        for j in range(len(other)):
-            carry = 0
-            for i in range(len(self)):
-                product = self._digits[i] * other._digits[j] + carry
-                carry = product // 10
-                product %= 10
+        u, v = self._digits, other._digits
+        if len(u) == 1 and len(v) == 1:
+            # Single-limb operands are multiplied directly, without going through the kernel
+            high, low = divmod(u[0] * v[0], BASE)
+            return BigInt._from_limbs([low, high] if high != 0 else [low])
 
-                result.add_at(j + i, product)
-            if carry != 0: result.add_at(j + len(self), carry)
-        
-        return result
+        w = _mul_limbs(u, v)
+        while w and w[-1] == 0: w.pop()
+        return BigInt._from_limbs(w)
 
     def __int__(self) -> int:
         """Returns the integral value of this big integer.
@@ -210,9 +457,8 @@ class BigInt:
             int: The integral value of this big integer.
         """
         val = 0
-        for i in range(len(self)):
-            digit = self._digits[i]
-            val += digit * 10**i
+        for limb in reversed(self._digits):
+            val = val * BASE + limb
         return val
     
     def __str__(self) -> str:
@@ -221,10 +467,9 @@ class BigInt:
         Returns:
             str: The string representation of this big integer.
         """
-        s = ""
-        for digit in self._digits:
-            s = f"{digit}" + s
-        return s
+        digits = self._digits
+        if not digits: return ""
+        return f"{digits[-1]}" + "".join(f"{limb:0{BASE_DIGITS}d}" for limb in reversed(digits[:-1]))
 
     def __repr__(self) -> str:
         """Returns the canonical string representation of this big integer, such that `eval(repr(obj)) == obj`.
@@ -3,8 +3,23 @@
 # i.e. pairs of digits that occupy the same decimal place on A and B.
 
 # TODO: Add problem analysis and algorithm explanation
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from bigint import BigInt
 
+def swap_digits_at(a: BigInt, b: BigInt, pos: int) -> None:
+    """Swaps the digits of A and B at the given decimal position.
+
+    Args:
+        a (BigNumber): The value of A.
+        b (BigNumber): The value of B.
+        pos (int): The decimal position of the digits to swap.
+    """
+    digit_a, digit_b = a.digit_at_decimal(pos), b.digit_at_decimal(pos)
+    a.set_digit_at_decimal(pos, digit_b)
+    b.set_digit_at_decimal(pos, digit_a)
+
 def calc_extreme_products_brute(a: BigInt, b: BigInt, idx: int = 0) -> tuple[BigInt, BigInt, BigInt, BigInt, BigInt, BigInt]:
     """Calculates the extremum (maximum and minimum) of the product C times D via brute force depth-first search.
     Guaranteed to find the global extrema, courtesy to the brute force algorithm.
@@ -22,17 +37,45 @@ def calc_extreme_products_brute(a: BigInt, b: BigInt, idx: int = 0) -> tuple[Big
         tuple[BigNumber, BigNumber, BigNumber, BigNumber, BigNumber, BigNumber]: The value of C, D, and the product C times D,
         for both the maximum and minimum possible value of C times D.
     """
-    if len(a) != len(b): raise ValueError("mismatched number length")
-    if idx >= len(a):
+    n = len(a)
+    if n != len(b): raise ValueError("mismatched number length")
+
+    mirrored = all(a.digit_at_decimal(i) == b.digit_at_decimal(i) for i in range(idx))
+    return _search_extreme_products(a, b, idx, n, mirrored)
+
+def _search_extreme_products(a: BigInt, b: BigInt, idx: int, n: int, mirrored: bool) -> tuple[BigInt, BigInt, BigInt, BigInt, BigInt, BigInt]:
+    """Performs the depth-first search of `calc_extreme_products_brute`, skipping branches that cannot yield new products.
+
+    Args:
+        a (BigNumber): The value of A.
+        b (BigNumber): The value of B.
+        idx (int): The starting index of the search. Swapping is done on digits of this and following indices.
+        n (int): The amount of digits of A and B.
+        mirrored (bool): Whether A and B agree on all digits below `idx`, in which case swapping every remaining digit
+        only exchanges C and D, leaving their product unchanged.
+
+    Returns:
+        tuple[BigNumber, BigNumber, BigNumber, BigNumber, BigNumber, BigNumber]: The value of C, D, and the product C times D,
+        for both the maximum and minimum possible value of C times D.
+    """
+    if idx >= n:
         # Base case: Compute and return the product
         prod = a * b
         return a.clone(), b.clone(), prod, a.clone(), b.clone(), prod.clone()
+
+    digit_a, digit_b = a.digit_at_decimal(idx), b.digit_at_decimal(idx)
+    if digit_a == digit_b:
+        # Swapping equal digits leaves the pair unchanged, so both branches are the same
+        return _search_extreme_products(a, b, idx + 1, n, mirrored)
+    if mirrored:
+        # The swapped branch is the mirror image of the original branch, with C and D exchanged
+        return _search_extreme_products(a, b, idx + 1, n, False)
     
     # Recursive case: Compare the result of the original pair and the pair that has their digits at idx swapped
-    c1_max, d1_max, p1_max, c1_min, d1_min, p1_min = calc_extreme_products_brute(a, b, idx + 1)
-    a.digits[idx], b.digits[idx] = b.digits[idx], a.digits[idx]
-    c2_max, d2_max, p2_max, c2_min, d2_min, p2_min = calc_extreme_products_brute(a, b, idx + 1)
-    a.digits[idx], b.digits[idx] = b.digits[idx], a.digits[idx]
+    c1_max, d1_max, p1_max, c1_min, d1_min, p1_min = _search_extreme_products(a, b, idx + 1, n, False)
+    swap_digits_at(a, b, idx)
+    c2_max, d2_max, p2_max, c2_min, d2_min, p2_min = _search_extreme_products(a, b, idx + 1, n, False)
+    swap_digits_at(a, b, idx)
 
     # Choose and return the extreme values
     cr_max, dr_max, pr_max = (c1_max, d1_max, p1_max) if p1_max >= p2_max else (c2_max, d2_max, p2_max)
@@ -40,6 +83,78 @@ def calc_extreme_products_brute(a: BigInt, b: BigInt, idx: int = 0) -> tuple[Big
 
     return cr_max, dr_max, pr_max, cr_min, dr_min, pr_min
 
+def calc_extreme_products_parallel(
+        a: BigInt, b: BigInt, idx: int = 0, *,
+        depth: int = 6,
+        max_workers: int | None = None
+    ) -> tuple[BigInt, BigInt, BigInt, BigInt, BigInt, BigInt]:
+    """Calculates the extremum (maximum and minimum) of the product C times D via brute force depth-first search,
+    like `calc_extreme_products_brute`, but searches the subtrees below the first `depth` digits in worker processes.
+
+    Args:
+        a (BigNumber): The value of A.
+        b (BigNumber): The value of B.
+        idx (int, optional): The starting index of the search. Swapping is done on digits of this and following indices.
+        Defaults to 0, which enables swapping on all digits.
+        depth (int, optional): The amount of digits whose swaps are enumerated up front, each resulting pair being searched
+        as a separate task. Must not be negative. Defaults to 6.
+        max_workers (int | None, optional): The maximum amount of worker processes. Defaults to None, which uses the
+        executor's default.
+
+    Raises:
+        ValueError: A and B does not have the same amount of digits, or `depth` is negative.
+
+    Returns:
+        tuple[BigNumber, BigNumber, BigNumber, BigNumber, BigNumber, BigNumber]: The value of C, D, and the product C times D,
+        for both the maximum and minimum possible value of C times D.
+    """
+    n = len(a)
+    if n != len(b): raise ValueError("mismatched number length")
+    if depth < 0: raise ValueError("negative search depth")
+
+    mirrored = all(a.digit_at_decimal(i) == b.digit_at_decimal(i) for i in range(idx))
+    stop = min(n, idx + depth)
+    cs, ds, ms = zip(*_expand_prefixes(a, b, idx, stop, mirrored))
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        results = list(executor.map(_search_extreme_products, cs, ds, repeat(stop), repeat(n), ms))
+
+    # Choose and return the extreme values across all tasks
+    cr_max, dr_max, pr_max, cr_min, dr_min, pr_min = results[0]
+    for c_max, d_max, p_max, c_min, d_min, p_min in results[1:]:
+        if p_max > pr_max: cr_max, dr_max, pr_max = c_max, d_max, p_max
+        if p_min < pr_min: cr_min, dr_min, pr_min = c_min, d_min, p_min
+
+    return cr_max, dr_max, pr_max, cr_min, dr_min, pr_min
+
+def _expand_prefixes(a: BigInt, b: BigInt, idx: int, stop: int, mirrored: bool) -> Iterator[tuple[BigInt, BigInt, bool]]:
+    """Enumerates the pairs reachable by swapping the digits of A and B at indices from `idx` up to `stop`,
+    skipping the same redundant branches as `_search_extreme_products`.
+
+    Args:
+        a (BigNumber): The value of A.
+        b (BigNumber): The value of B.
+        idx (int): The starting index of the enumeration.
+        stop (int): The index at which the enumeration stops.
+        mirrored (bool): Whether A and B agree on all digits below `idx`.
+
+    Yields:
+        tuple[BigNumber, BigNumber, bool]: A copy of each reachable pair, and whether it still agrees on all digits below `stop`.
+    """
+    if idx >= stop:
+        yield a.clone(), b.clone(), mirrored
+        return
+
+    digit_a, digit_b = a.digit_at_decimal(idx), b.digit_at_decimal(idx)
+    if digit_a == digit_b or mirrored:
+        yield from _expand_prefixes(a, b, idx + 1, stop, mirrored and digit_a == digit_b)
+        return
+
+    yield from _expand_prefixes(a, b, idx + 1, stop, False)
+    swap_digits_at(a, b, idx)
+    yield from _expand_prefixes(a, b, idx + 1, stop, False)
+    swap_digits_at(a, b, idx)
+
 def calc_max_product(a: BigInt, b: BigInt) -> tuple[BigInt, BigInt, BigInt]:
     """Calculates the maximum of the product C and D via the above algorithm.
 
@@ -55,18 +170,15 @@ def calc_max_product(a: BigInt, b: BigInt) -> tuple[BigInt, BigInt, BigInt]:
     """
     if len(a) != len(b): raise ValueError("mismatched number length")
 
-    c = a.clone()
-    d = b.clone()
-    found_diff = False
-    for i in range(-1, -len(a) - 1, -1):
-        curr_diff = c.digits[i] != d.digits[i]
-
-        # If this is the first different pair of digits, choose the larger digit for A
-        # Otherwise, choose the smaller digit for A
-        if (not found_diff and curr_diff and c.digits[i] < d.digits[i]) or (found_diff and c.digits[i] > d.digits[i]):
-            c.digits[i], d.digits[i] = d.digits[i], c.digits[i]
-            
-        found_diff = found_diff or c.digits[i] != d.digits[i]
+    a_digits, b_digits = a.digits, b.digits
+    n = len(a_digits)
+    first_diff = next((i for i in range(n - 1, -1, -1) if a_digits[i] != b_digits[i]), 0)
+
+    # Choose the larger digit for A from the first different pair of digits upwards (the digits above it are equal)
+    # Otherwise, choose the smaller digit for A
+    c, d = BigInt(digit_count=0), BigInt(digit_count=0)
+    c.digits = list(map(min, a_digits[:first_diff], b_digits[:first_diff])) + list(map(max, a_digits[first_diff:], b_digits[first_diff:]))
+    d.digits = list(map(max, a_digits[:first_diff], b_digits[:first_diff])) + list(map(min, a_digits[first_diff:], b_digits[first_diff:]))
         
     return c, d, c * d
 
@@ -85,12 +197,12 @@ def calc_min_product(a: BigInt, b: BigInt) -> tuple[BigInt, BigInt, BigInt]:
     """
     if len(a) != len(b): raise ValueError("mismatched number length")
 
-    c = a.clone()
-    d = b.clone()
-    for i in range(-1, -len(a) - 1, -1):
-        # Take all the largest digits for A
-        if c.digits[i] < d.digits[i]:
-            c.digits[i], d.digits[i] = d.digits[i], c.digits[i]
+    a_digits, b_digits = a.digits, b.digits
+
+    # Take all the largest digits for A
+    c, d = BigInt(digit_count=0), BigInt(digit_count=0)
+    c.digits = list(map(max, a_digits, b_digits))
+    d.digits = list(map(min, a_digits, b_digits))
         
     return c, d, c * d
 